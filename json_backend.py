@@ -0,0 +1,103 @@
+"""
+Picks the fastest available JSON library: orjson, then rapidjson, then ujson,
+then the standard library json module.
+
+All backends are exposed through the same interface: loads accepts bytes or
+any buffer object, dumps always returns UTF-8 encoded bytes, and decode
+failures raise JSONDecodeError.
+"""
+import json
+
+# orjson silently turns integers outside the 64-bit range into floats; any run of
+# 19+ digits may be one (e.g. -9223372036854775809), so such inputs go to the stdlib
+WIDE_INTEGER_DIGITS = 19
+# Mapping every digit to b'0' turns the digit-run check into a plain substring search
+_DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'0' * 9)
+_WIDE_INTEGER_RUN = b'0' * WIDE_INTEGER_DIGITS
+# Inputs are scanned in chunks so the translated copy stays small
+_SCAN_CHUNK_SIZE = 1 << 20
+
+
+def _has_wide_integer(data):
+    with memoryview(data) as view:
+        overlap = WIDE_INTEGER_DIGITS - 1
+        for start in range(0, len(view), _SCAN_CHUNK_SIZE):
+            chunk = bytes(view[start:start + _SCAN_CHUNK_SIZE + overlap])
+            if _WIDE_INTEGER_RUN in chunk.translate(_DIGITS_TO_ZERO):
+                return True
+    return False
+
+
+class NonFiniteFloat(float):
+    """
+    A NaN or infinity decoded from a NaN/Infinity/-Infinity literal.
+
+    orjson would silently write these as null; it rejects float subclasses
+    instead, so dumps falls back to the stdlib encoder and the literal survives.
+    """
+
+
+def _stdlib_loads(data):
+    return json.loads(bytes(data), parse_constant=NonFiniteFloat)
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+try:
+    import orjson
+
+    BACKEND = 'orjson'
+    # orjson.JSONDecodeError subclasses this, so it covers both orjson and the stdlib fallback
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data):
+        # Inputs orjson cannot represent exactly (wide integers, NaN/Infinity literals)
+        # are handed to the stdlib decoder, which accepts them
+        if _has_wide_integer(data):
+            return _stdlib_loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return _stdlib_loads(data)
+
+    def dumps(obj):
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits or NonFiniteFloat values, which the stdlib encoder writes exactly
+            return _stdlib_dumps(obj)
+
+except ImportError:
+    try:
+        import rapidjson
+
+        BACKEND = 'rapidjson'
+        JSONDecodeError = rapidjson.JSONDecodeError
+
+        def loads(data):
+            return rapidjson.loads(bytes(data))
+
+        def dumps(obj):
+            return rapidjson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    except ImportError:
+        try:
+            import ujson
+
+            BACKEND = 'ujson'
+            # Older ujson releases raise a plain ValueError on invalid input
+            JSONDecodeError = getattr(ujson, 'JSONDecodeError', ValueError)
+
+            def loads(data):
+                return ujson.loads(bytes(data))
+
+            def dumps(obj):
+                return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+
+        except ImportError:
+            BACKEND = 'json'
+            JSONDecodeError = json.JSONDecodeError
+            loads = _stdlib_loads
+            dumps = _stdlib_dumps
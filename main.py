@@ -1,13 +1,87 @@
 import argparse
+import contextlib
+import functools
+import itertools
 import logging
-import json
+import mmap
+import os
+import stat
 import sys
+import tempfile
 import random
+import re
+import shutil
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from faker import Faker
 
+import json_backend
+
+# Input files with these extensions are read as newline-delimited JSON when streaming
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+# Key substrings and the Faker provider that replaces matching values, in match priority order
+CATEGORY_PROVIDERS = {
+    'name': 'name',
+    'email': 'email',
+    'phone': 'phone_number',
+    'address': 'address',
+    'city': 'city',
+}
+CATEGORY_PRIORITY = {category: priority for priority, category in enumerate(CATEGORY_PROVIDERS)}
+
+# Finds every category in a key in one case-insensitive scan; the lookahead also reports overlapping matches
+CATEGORY_PATTERN = re.compile('(?=(' + '|'.join(CATEGORY_PROVIDERS) + '))', re.IGNORECASE)
+
+# Number of distinct (key, level) classifications remembered across datasets
+KEY_CACHE_SIZE = 4096
+
+# Categories replaced at the 'low' anonymization level
+LOW_LEVEL_CATEGORIES = ('name', 'email', 'phone')
+
+# Maximum number of pre-generated Faker values sampled from per provider and batch
+POOL_SIZE = 1024
+
+# Output files are written through a 1 MB buffer so per-dataset writes do not each become a syscall
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Building a Faker instance loads every provider, so one is shared and reseeded per batch
+_fake = Faker()
+
+# Inputs with fewer records than this are anonymized in-process unless --workers is given
+PARALLEL_MIN_RECORDS = 10000
+
+# Datasets are anonymized, and streamed, in batches of at most this many records
+BATCH_RECORDS = 10000
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def _int_at_least(value, minimum):
+    """
+    Parses a command-line value as an integer no smaller than minimum.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < minimum:
+        raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {number}")
+    return number
+
+def positive_int(value):
+    """
+    Parses a command-line value as an integer of at least 1.
+    """
+    return _int_at_least(value, 1)
+
+def non_negative_int(value):
+    """
+    Parses a command-line value as an integer of at least 0.
+    """
+    return _int_at_least(value, 0)
+
 def setup_argparse():
     """
     Sets up the argument parser for the CLI.
@@ -21,7 +95,9 @@ def setup_argparse():
     parser.add_argument('--remove-non-essential', action='store_true', help='Remove non-essential relationships.')
     parser.add_argument('--anonymize-data', action='store_true', help='Anonymize data in the datasets.')
     parser.add_argument('--anonymization-level', type=str, choices=['low', 'medium', 'high'], default='medium', help='Level of anonymization (low, medium, high). Defaults to medium.')
-    parser.add_argument('--seed', type=int, help='Seed for random number generator (for reproducibility).')
+    parser.add_argument('--workers', type=positive_int, help='Number of worker processes used for anonymization. Defaults to the CPU count, or a single process for small inputs. Ignored with --stream.')
+    parser.add_argument('--stream', action='store_true', help='Process records in batches instead of loading the whole input into memory.')
+    parser.add_argument('--seed', type=non_negative_int, help='Non-negative seed for random number generator (for reproducibility).')
 
     return parser.parse_args()
 
@@ -34,20 +110,27 @@ def load_data(input_file):
         dict: Data loaded from the JSON file.
     """
     try:
-        with open(input_file, 'r') as f:
-            data = json.load(f)
+        with open(input_file, 'rb') as f:
+            info = os.fstat(f.fileno())
+            if stat.S_ISREG(info.st_mode) and info.st_size > 0:
+                # Parse straight from the mapped pages instead of copying the file into a bytes object
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    data = json_backend.loads(view)
+            else:
+                # Pipes, FIFOs and empty files cannot be memory-mapped
+                data = json_backend.loads(f.read())
         return data
     except FileNotFoundError:
         logging.error(f"Input file not found: {input_file}")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except json_backend.JSONDecodeError:
         logging.error(f"Invalid JSON format in file: {input_file}")
         sys.exit(1)
     except Exception as e:
         logging.error(f"Error loading data: {e}")
         sys.exit(1)
 
-def simplify_relationships(data, remove_redundant=False, remove_non_essential=False):
+def simplify_relationships(data, remove_redundant=False, remove_non_essential=False, seed=None):
     """
     Simplifies data relationships by removing redundant or non-essential relationships.
 
@@ -55,6 +138,7 @@ def simplify_relationships(data, remove_redundant=False, remove_non_essential=Fa
         data (dict): The data containing relationships between datasets.
         remove_redundant (bool): Whether to remove redundant relationships.
         remove_non_essential (bool): Whether to remove non-essential relationships.
+        seed (int): Non-negative seed for random number generation.
 
     Returns:
         dict: The simplified data with updated relationships.
@@ -80,40 +164,218 @@ def simplify_relationships(data, remove_redundant=False, remove_non_essential=Fa
     # Implement logic to identify and remove redundant/non-essential relationships
     # This is a placeholder and needs to be adapted to the actual data structure.
 
-    simplified_relationships = relationships[:]  # Start with a copy of the original relationships
+    simplified_relationships = relationships  # Each filter below builds a new list, so no copy is needed
 
-    if remove_redundant:
-        # Example: Removing duplicates (assuming each relationship is a tuple of (dataset1, dataset2))
+    if remove_non_essential:
+        # Example: Removing relationships based on a simple heuristic (e.g., relationships with low interaction count)
+        # Draw the whole keep mask in one vectorized call instead of one random.random() per relationship
+        keep_mask = (np.random.default_rng(seed).random(len(relationships)) > 0.2).tolist()  # Keep 80% of relationships
+
+    if remove_redundant and remove_non_essential:
+        # Apply both filters in a single pass rather than building an intermediate list
         seen = set()
-        simplified_relationships = [r for r in simplified_relationships if tuple(r) not in seen and not seen.add(tuple(r))]
-        logging.info("Redundant relationships removed.")
+        simplified_relationships = []
+        for relationship, keep in zip(relationships, keep_mask):
+            key = tuple(relationship)
+            if key in seen:
+                continue
+            seen.add(key)
+            if keep:
+                simplified_relationships.append(relationship)
+    elif remove_redundant:
+        # Example: Removing duplicates (assuming each relationship is a tuple of (dataset1, dataset2))
+        # Keep the first original relationship per key, hashing each one once
+        unique = {}
+        for relationship in relationships:
+            unique.setdefault(tuple(relationship), relationship)
+        simplified_relationships = list(unique.values())
+    elif remove_non_essential:
+        simplified_relationships = [r for r, keep in zip(relationships, keep_mask) if keep]
 
+    if remove_redundant:
+        logging.info("Redundant relationships removed.")
     if remove_non_essential:
-        # Example: Removing relationships based on a simple heuristic (e.g., relationships with low interaction count)
-        simplified_relationships = [r for r in simplified_relationships if random.random() > 0.2] #Keep 80% of relationships
         logging.info("Non-essential relationships removed.")
 
     data['relationships'] = simplified_relationships
     return data
 
-def anonymize_data(data, level='medium', seed=None):
+@functools.lru_cache(maxsize=KEY_CACHE_SIZE)
+def _key_provider(key, level):
+    """
+    Resolves the Faker provider used to replace string values under a key.
+
+    Results are cached, so a key shared by many datasets is matched and
+    lowercased once per process rather than once per dataset.
+
+    Args:
+        key (str): The record key.
+        level (str): The anonymization level ('low' or 'medium').
+    Returns:
+        str: The provider name, or None if values under this key are kept.
+    """
+    matches = CATEGORY_PATTERN.findall(key)
+    if matches:
+        category = min((match.lower() for match in matches), key=CATEGORY_PRIORITY.__getitem__)
+        if level == 'low' and category not in LOW_LEVEL_CATEGORIES:
+            return None
+        return CATEGORY_PROVIDERS[category]
+    # Replace with more generic data at medium level (e.g., generic words)
+    return 'word' if level == 'medium' else None
+
+def _validate_dataset(dataset):
+    """
+    Checks that a dataset is a list of record dictionaries.
+    Args:
+        dataset (list): The dataset to validate.
+    Returns:
+        list: The validated dataset.
+    """
+    if not isinstance(dataset, list):
+        logging.error("Each dataset should be a list.")
+        raise ValueError("Each dataset should be a list.")
+    if not all(isinstance(record, dict) for record in dataset):
+        logging.error("Each record in the dataset should be a dictionary.")
+        raise ValueError("Each record in the dataset should be a dictionary.")
+    return dataset
+
+def _uuid_strings(rand, count):
+    """
+    Generates random version 4 UUID strings from a single bulk draw of random bytes.
+    Args:
+        rand (random.Random): The generator supplying the random bytes.
+        count (int): The number of UUIDs to generate.
+    Returns:
+        list: The UUIDs in canonical hyphenated form.
+    """
+    raw = bytearray(rand.randbytes(16 * count))
+    # Set the version (4) and variant (RFC 4122) bits of every UUID
+    raw[6::16] = bytes(byte & 0x0F | 0x40 for byte in raw[6::16])
+    raw[8::16] = bytes(byte & 0x3F | 0x80 for byte in raw[8::16])
+    digits = raw.hex()
+    return [f'{digits[i:i + 8]}-{digits[i + 8:i + 12]}-{digits[i + 12:i + 16]}-{digits[i + 16:i + 20]}-{digits[i + 20:i + 32]}'
+            for i in range(0, len(digits), 32)]
+
+def _anonymize_dataset(dataset, level, fake, rand, rng):
+    """
+    Anonymizes the records of a single dataset in place.
+    Args:
+        dataset (list): The records to anonymize.
+        level (str): The anonymization level ('low', 'medium', 'high').
+        fake (Faker): The Faker instance used to generate replacement values.
+        rand (random.Random): The generator used for UUIDs.
+        rng (numpy.random.Generator): The generator used for pool sampling and replacement integers.
+    Returns:
+        list: The anonymized dataset.
+    """
+    if level == 'high':
+        # Replace with completely random data (e.g., UUIDs, random strings)
+        uuids = iter(_uuid_strings(rand, sum(len(record) for record in dataset)))
+        for record in dataset:
+            for key in record:
+                record[key] = next(uuids)
+        return dataset
+
+    replace_ints = level == 'medium'
+
+    # Collect the rows holding a string or integer under each key, so every
+    # column is then filled with one vectorized draw written back in place
+    str_rows = {}
+    int_rows = {}
+    for i, record in enumerate(dataset):
+        for key, value in record.items():
+            value_type = type(value)
+            if value_type is str:
+                str_rows.setdefault(key, []).append(i)
+            elif replace_ints and (value_type is int or value_type is bool):
+                int_rows.setdefault(key, []).append(i)
+
+    # Group the string columns by the Faker provider that replaces them
+    provider_columns = {}
+    for key, rows in str_rows.items():
+        provider = _key_provider(key, level)
+        if provider is not None:
+            provider_columns.setdefault(provider, []).append((key, rows))
+
+    for provider, columns in provider_columns.items():
+        total = sum(len(rows) for _, rows in columns)
+        generate = getattr(fake, provider)
+        # Interned so repeated Faker values share one string object
+        pool = [sys.intern(generate()) for _ in range(min(POOL_SIZE, total))]
+        if total <= POOL_SIZE:
+            # Every cell gets its own freshly generated value, i.e. sampling without replacement
+            values = iter(pool)
+            for key, rows in columns:
+                for i in rows:
+                    dataset[i][key] = next(values)
+        else:
+            # Cells reference pool entries directly, picked by one vectorized draw of indices per column
+            for key, rows in columns:
+                for i, index in zip(rows, rng.integers(0, len(pool), len(rows)).tolist()):
+                    dataset[i][key] = pool[index]
+
+    # Replace with random integers, drawn for the whole column at once
+    for key, rows in int_rows.items():
+        for i, number in zip(rows, rng.integers(0, 101, len(rows)).tolist()):
+            dataset[i][key] = number
+
+    return dataset
+
+def _anonymize_one(dataset, level, seed=None):
+    """
+    Anonymizes a single batch of records with freshly seeded generators.
+
+    Module-level so it can be dispatched to worker processes; per-batch
+    seeds keep results reproducible regardless of how work is scheduled.
+    The shared Faker instance is reseeded rather than rebuilt, and a private
+    random.Random is used so the global RNG is left untouched.
+
+    Args:
+        dataset (list): The batch of records to anonymize.
+        level (str): The anonymization level ('low', 'medium', 'high').
+        seed (int): Non-negative seed for random number generation.
+    Returns:
+        list: The anonymized dataset.
+    """
+    _fake.seed_instance(seed)
+    rand = random.Random(seed)
+    rng = np.random.default_rng(seed)
+
+    return _anonymize_dataset(dataset, level, _fake, rand, rng)
+
+def _batch_seeds(seed):
+    """
+    Yields the seed for each successive batch, derived from the base seed.
+    """
+    for offset in itertools.count():
+        yield None if seed is None else seed + offset
+
+def iter_batches(records):
+    """
+    Yields successive lists of at most BATCH_RECORDS records.
+    Args:
+        records (iterable): The records to split.
+    Yields:
+        list: The next batch of records.
+    """
+    records = iter(records)
+    while batch := list(itertools.islice(records, BATCH_RECORDS)):
+        yield batch
+
+def anonymize_data(data, level='medium', seed=None, workers=None):
     """
     Anonymizes data within the datasets.
     Args:
         data (dict): The data containing datasets.
         level (str): The anonymization level ('low', 'medium', 'high').
-        seed (int): Seed for random number generation.
+        seed (int): Non-negative seed for random number generation.
+        workers (int): Number of worker processes (defaults to the CPU count, or
+            in-process for inputs under PARALLEL_MIN_RECORDS records).
     Returns:
         dict: The data with anonymized values.
     """
     logging.info(f"Anonymizing data at level: {level}")
 
-    if seed is not None:
-        random.seed(seed)
-
-    fake = Faker()
-    Faker.seed(seed)
-
     # Example: Assuming datasets are stored in a 'datasets' key, and each dataset is a list of dictionaries
     if 'datasets' not in data:
         logging.warning("No 'datasets' key found in the data. Skipping anonymization.")
@@ -125,65 +387,279 @@ def anonymize_data(data, level='medium', seed=None):
         logging.error("Datasets must be a list.")
         raise ValueError("Datasets must be a list.")
 
-
+    # Validate the container shape once, before any work is dispatched
     for dataset in datasets:
-        if not isinstance(dataset, list):
-            logging.error("Each dataset should be a list.")
-            raise ValueError("Each dataset should be a list.")
-        for record in dataset:
-            if not isinstance(record, dict):
-                logging.error("Each record in the dataset should be a dictionary.")
-                raise ValueError("Each record in the dataset should be a dictionary.")
-
-            for key, value in record.items():
-                if level == 'low':
-                    # Replace with similar-looking data (e.g., names with similar names)
-                    if isinstance(value, str) and "name" in key.lower():
-                        record[key] = fake.name()
-                    elif isinstance(value, str) and "email" in key.lower():
-                        record[key] = fake.email()
-                    elif isinstance(value, str) and "phone" in key.lower():
-                        record[key] = fake.phone_number()
-                elif level == 'medium':
-                    # Replace with more generic data (e.g., generic names, addresses)
-                     if isinstance(value, str):
-                        if "name" in key.lower():
-                            record[key] = fake.name()
-                        elif "email" in key.lower():
-                            record[key] = fake.email()
-                        elif "phone" in key.lower():
-                            record[key] = fake.phone_number()
-                        elif "address" in key.lower():
-                            record[key] = fake.address()
-                        elif "city" in key.lower():
-                            record[key] = fake.city()
-                        else:
-                            record[key] = fake.word()
-                    elif isinstance(value, int):
-                        record[key] = random.randint(0, 100)  # Replace with a random integer
-
-                elif level == 'high':
-                    # Replace with completely random data (e.g., UUIDs, random strings)
-                    record[key] = fake.uuid4()
+        _validate_dataset(dataset)
+
+    # Datasets are split into the same batches --stream works in, so both paths give the same output.
+    # Batches are independent, so they are anonymized in parallel across processes.
+    # Small inputs stay in-process unless workers is given, as the pool and pickling cost more than they save.
+    batches = [batch for dataset in datasets for batch in iter_batches(dataset)]
+    batch_counts = [-(-len(dataset) // BATCH_RECORDS) for dataset in datasets]
+    levels = itertools.repeat(level)
+    if workers is None and sum(len(dataset) for dataset in datasets) < PARALLEL_MIN_RECORDS:
+        workers = 1
+    if workers == 1 or len(batches) < 2:
+        results = map(_anonymize_one, batches, levels, _batch_seeds(seed))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_anonymize_one, batches, levels, _batch_seeds(seed)))
+
+    results = iter(results)
+    data['datasets'] = [list(itertools.chain.from_iterable(itertools.islice(results, count))) for count in batch_counts]
 
     return data
 
 
+@contextlib.contextmanager
+def _open_output(output_file):
+    """
+    Opens the output file for buffered binary writing.
+
+    Regular files are written to a uniquely named temporary file next to the
+    target and renamed into place on success, so a failure part way through
+    never leaves a truncated document behind. Symlinks and other targets (e.g. /dev/stdout)
+    are written directly.
+
+    Args:
+        output_file (str): Path to the output file.
+    Yields:
+        file: The binary file to write to.
+    """
+    if os.path.islink(output_file) or (os.path.exists(output_file) and not os.path.isfile(output_file)):
+        with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        return
+
+    fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(output_file) or '.', prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        # mkstemp creates the file as 0600; give it the permissions the target has or would get
+        if os.path.exists(output_file):
+            shutil.copymode(output_file, temp_file)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_file, 0o666 & ~umask)
+        os.replace(temp_file, output_file)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_file)
+        raise
+
+def _write_document(f, fields):
+    """
+    Writes a JSON object to a binary file, one top-level field per line.
+    Args:
+        f (file): The binary file to write to.
+        fields (iterable): The (key, value) pairs of the object. A 'datasets' value that
+            is a list or an iterator is serialized one dataset at a time, one per line;
+            a dataset that is itself an iterator of records is written in batches.
+    """
+    f.write(b'{')
+    for n, (key, value) in enumerate(fields):
+        if n:
+            f.write(b',\n')
+        f.write(json_backend.dumps(key) + b':')
+        if key == 'datasets' and isinstance(value, (list, Iterator)):
+            f.write(b'[')
+            for i, dataset in enumerate(value):
+                if i:
+                    f.write(b',\n')
+                if isinstance(dataset, Iterator):
+                    # Each batch is encoded as an array and its brackets dropped, giving the same bytes as one dump
+                    f.write(b'[' + b','.join(json_backend.dumps(batch)[1:-1] for batch in iter_batches(dataset)) + b']')
+                else:
+                    f.write(json_backend.dumps(dataset))
+            f.write(b']')
+        else:
+            f.write(json_backend.dumps(value))
+    f.write(b'}\n')
+
 def save_data(data, output_file):
     """
     Saves the data to a JSON file.
+
+    Datasets are serialized one at a time, so the encoded output never has to
+    be held in memory alongside the whole data dict.
+
     Args:
         data (dict): The data to save.
         output_file (str): Path to the output JSON file.
     """
     try:
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=4)
+        with _open_output(output_file) as f:
+            _write_document(f, data.items())
         logging.info(f"Data saved to: {output_file}")
     except Exception as e:
         logging.error(f"Error saving data: {e}")
         sys.exit(1)
 
+
+def iter_datasets(f):
+    """
+    Lazily yields the datasets of a newline-delimited JSON file, one per line.
+    Args:
+        f (file): The binary file to read.
+    Yields:
+        list: The records of one dataset.
+    """
+    for line in f:
+        if line.strip():
+            yield json_backend.loads(line)
+
+def _build_value(events, event, value):
+    """
+    Builds one complete JSON value from an ijson event stream.
+    Args:
+        events (iterator): The remaining (prefix, event, value) events.
+        event (str): The first event of the value.
+        value: The data carried by the first event.
+    Returns:
+        The decoded value.
+    """
+    import ijson
+    builder = ijson.ObjectBuilder()
+    depth = 0
+    while True:
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+        if depth == 0:
+            return builder.value
+        _, event, value = next(events)
+
+def _iter_array(events):
+    """
+    Yields the items of a JSON array one at a time from an ijson event stream
+    positioned just after its 'start_array' event.
+    """
+    for _, event, value in events:
+        if event == 'end_array':
+            return
+        yield _build_value(events, event, value)
+
+def _iter_datasets(events):
+    """
+    Yields the datasets of a 'datasets' array from an ijson event stream
+    positioned just after its 'start_array' event. An array dataset is yielded
+    as an iterator over its records, which must be consumed before the next
+    dataset is requested.
+    """
+    for _, event, value in events:
+        if event == 'end_array':
+            return
+        if event == 'start_array':
+            yield _iter_array(events)
+        else:
+            yield _build_value(events, event, value)
+
+def iter_fields(f):
+    """
+    Lazily yields the top-level fields of a JSON object in file order.
+
+    A 'datasets' array is yielded as an iterator over its datasets, and each
+    dataset as an iterator over its records; both must be consumed before the
+    next item is requested. Every other value is decoded in full.
+
+    Args:
+        f (file): The binary file to parse.
+    Yields:
+        tuple: The (key, value) pair of each top-level field.
+    """
+    import ijson
+    events = ijson.parse(f, use_float=True)
+    _, event, _ = next(events)
+    if event != 'start_map':
+        logging.error("Input data must be a dictionary.")
+        raise ValueError("Input data must be a dictionary.")
+    for prefix, event, value in events:
+        if prefix == '' and event == 'map_key':
+            key = value
+            _, event, value = next(events)
+            if key == 'datasets' and event == 'start_array':
+                yield key, _iter_datasets(events)
+            else:
+                yield key, _build_value(events, event, value)
+
+def stream_data(input_file, output_file, remove_redundant=False, remove_non_essential=False, anonymize=False, level='medium', seed=None):
+    """
+    Simplifies and anonymizes data in a single streaming pass.
+
+    Unlike load_data/save_data, records are read, anonymized and written in
+    batches of BATCH_RECORDS, so peak memory is bounded by one batch rather
+    than the whole file (by one line for ND-JSON input). All other top-level
+    fields are passed through in file order.
+
+    Args:
+        input_file (str): Path to the input JSON or ND-JSON file.
+        output_file (str): Path to the output JSON file.
+        remove_redundant (bool): Whether to remove redundant relationships.
+        remove_non_essential (bool): Whether to remove non-essential relationships.
+        anonymize (bool): Whether to anonymize the datasets.
+        level (str): The anonymization level ('low', 'medium', 'high').
+        seed (int): Non-negative seed for random number generation.
+    """
+    logging.info(f"Streaming data from: {input_file}")
+    ndjson = input_file.endswith(NDJSON_EXTENSIONS)
+
+    try:
+        import ijson
+        decode_errors = (json_backend.JSONDecodeError, ijson.JSONError)
+    except ImportError:
+        if not ndjson:
+            logging.error("Streaming JSON input requires the 'ijson' package.")
+            sys.exit(1)
+        decode_errors = (json_backend.JSONDecodeError,)
+
+    if anonymize:
+        logging.info(f"Anonymizing data at level: {level}")
+
+    def anonymize_datasets(datasets):
+        seeds = _batch_seeds(seed)
+        for dataset in datasets:
+            if not isinstance(dataset, (list, Iterator)):
+                logging.error("Each dataset should be a list.")
+                raise ValueError("Each dataset should be a list.")
+            batches = (_anonymize_one(_validate_dataset(batch), level, next(seeds)) for batch in iter_batches(dataset))
+            yield itertools.chain.from_iterable(batches)
+
+    def process(fields):
+        seen = set()
+        for key, value in fields:
+            seen.add(key)
+            if key == 'relationships':
+                value = simplify_relationships({key: value}, remove_redundant, remove_non_essential, seed)[key]
+            elif key == 'datasets' and anonymize:
+                if not isinstance(value, Iterator):
+                    logging.error("Datasets must be a list.")
+                    raise ValueError("Datasets must be a list.")
+                value = anonymize_datasets(value)
+            yield key, value
+
+        if 'relationships' not in seen and not ndjson:
+            logging.warning("No 'relationships' key found in the data. Skipping simplification.")
+        if 'datasets' not in seen and anonymize:
+            logging.warning("No 'datasets' key found in the data. Skipping anonymization.")
+
+    try:
+        with open(input_file, 'rb') as f, _open_output(output_file) as out:
+            if ndjson:
+                fields = [('datasets', iter_datasets(f))]
+            else:
+                fields = iter_fields(f)
+            _write_document(out, process(fields))
+        logging.info(f"Data saved to: {output_file}")
+    except FileNotFoundError:
+        logging.error(f"Input file not found: {input_file}")
+        sys.exit(1)
+    except decode_errors:
+        logging.error(f"Invalid JSON format in file: {input_file}")
+        sys.exit(1)
+
 def main():
     """
     Main function to execute the data relationship simplification and anonymization.
@@ -196,13 +672,17 @@ def main():
         sys.exit(1)
 
     try:
-        data = load_data(args.input)
-        simplified_data = simplify_relationships(data, args.remove_redundant, args.remove_non_essential)
+        if args.stream:
+            stream_data(args.input, args.output, args.remove_redundant, args.remove_non_essential,
+                        args.anonymize_data, args.anonymization_level, args.seed)
+        else:
+            data = load_data(args.input)
+            simplified_data = simplify_relationships(data, args.remove_redundant, args.remove_non_essential, args.seed)
 
-        if args.anonymize_data:
-            simplified_data = anonymize_data(simplified_data, args.anonymization_level, args.seed)
+            if args.anonymize_data:
+                simplified_data = anonymize_data(simplified_data, args.anonymization_level, args.seed, args.workers)
 
-        save_data(simplified_data, args.output)
+            save_data(simplified_data, args.output)
 
     except Exception as e:
         logging.error(f"An error occurred: {e}")